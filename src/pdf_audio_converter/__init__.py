@@ -17,21 +17,44 @@ Usage:
 from pdf_audio_converter import text_to_speech, speech_to_text
 
 Notes: 
-- Keep imports lightweight to avoid GUI/CLI startup latency.
+- Keep imports lightweight to avoid GUI/CLI startup latency: public functions are
+  imported lazily on first access.
 
 ===================================================================
 """
 
-from .tts import text_to_speech
-from .stt import speech_to_text, transcribe_audio_file
-from .pdf_utils import extract_text_from_pdf, write_text_to_pdf
-
-__all__ = [
-    "text_to_speech",
-    "speech_to_text",
-    "transcribe_audio_file",
-    "extract_text_from_pdf",
-    "write_text_to_pdf",
-]
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public name -> submodule; loaded on first attribute access (PEP 562) so that
+# `import pdf_audio_converter` doesn't pull in pyttsx3, SpeechRecognition and the
+# PDF libraries until they are actually used.
+_LAZY = {
+    "text_to_speech": ".tts",
+    "speech_to_text": ".stt",
+    "transcribe_audio_file": ".stt",
+    "extract_text_from_pdf": ".pdf_utils",
+    "extract_text_pages": ".pdf_utils",
+    "write_text_to_pdf": ".pdf_utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __version__ = "0.1.0"
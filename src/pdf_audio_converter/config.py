@@ -23,19 +23,20 @@ Notes:
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from types import SimpleNamespace
 
-
-@dataclass(frozen=True)
-class Defaults:
-    tts_rate: int = 180
-    tts_volume: float = 0.9
-    tts_voice: str | None = None  # None = system default
+# A plain namespace rather than a dataclass keeps `import dataclasses` (and the
+# `inspect` machinery behind it) off the CLI's startup path.
+Defaults = SimpleNamespace(
+    tts_rate=180,
+    tts_volume=0.9,
+    tts_voice=None,  # None = system default
 
     # STT
-    language: str = "en-US"
-    phrase_time_limit: int | None = None  # seconds
+    language=sys.intern("en-US"),
+    phrase_time_limit=None,  # seconds; None = no limit
 
     # PDF
-    pdf_page_range: tuple[int | None, int | None] = (None, None)  # start, end (1-based)
-
+    pdf_page_range=(None, None),  # start, end (1-based)
+)
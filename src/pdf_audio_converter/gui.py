@@ -25,12 +25,13 @@ from __future__ import annotations
 
 import threading
 import tkinter as tk
+from itertools import chain
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
 
 from .config import Defaults
 from .logger import get_logger
-from .pdf_utils import extract_text_from_pdf, write_text_to_pdf
+from .pdf_utils import extract_text_pages, write_text_to_pdf
 from .stt import speech_to_text, transcribe_audio_file
 from .tts import text_to_speech, TTSEngine
 
@@ -156,22 +157,37 @@ class App(tk.Tk):
         if not path:
             messagebox.showwarning("Missing file", "Please choose a PDF file.")
             return
+        # Snapshot Tk variables here: they must only be read on the UI thread.
         try:
             start = self.tts_start.get() or None
             end = self.tts_end.get() or None
-            text = extract_text_from_pdf(path, page_range=(start, end))
-            if not text:
-                self._log(self.tts_log, "No text found; PDF might be scanned.")
-            self._tts_engine = text_to_speech(
-                text,
-                rate=self.rate_var.get(),
-                volume=float(self.volume_var.get()),
-                voice=self.voice_var.get().strip() or None,
-                async_play=True,
-            )
-            self._log(self.tts_log, f"Reading: {Path(path).name}")
+            rate = self.rate_var.get()
+            volume = float(self.volume_var.get())
+            voice = self.voice_var.get().strip() or None
         except Exception as e:
             messagebox.showerror("Error", str(e))
+            return
+
+        def run():
+            try:
+                pages = extract_text_pages(path, page_range=(start, end))
+                first = next((t for t in pages if t.strip()), None)
+                if first is None:
+                    self.after(0, self._log, self.tts_log, "No text found; PDF might be scanned.")
+                    return
+                self._tts_engine = text_to_speech(
+                    chain([first], pages),
+                    rate=rate,
+                    volume=volume,
+                    voice=voice,
+                    async_play=True,
+                    on_error=lambda e: self.after(0, messagebox.showerror, "TTS error", str(e)),
+                )
+                self.after(0, self._log, self.tts_log, f"Reading: {Path(path).name}")
+            except Exception as e:
+                self.after(0, messagebox.showerror, "Error", str(e))
+
+        threading.Thread(target=run, daemon=True).start()
 
     def _stop_tts(self) -> None:
         if self._tts_engine:
@@ -184,24 +200,27 @@ class App(tk.Tk):
             messagebox.showwarning("Missing file", "Choose an audio file or use Listen (Mic).")
             return
 
+        language = self.lang_var.get().strip()
+
         def run():
             try:
-                text = transcribe_audio_file(path, language=self.lang_var.get().strip())
-                self._set_text(self.stt_text, text)
+                text = transcribe_audio_file(path, language=language)
+                self.after(0, self._set_text, self.stt_text, text)
             except Exception as e:
-                messagebox.showerror("Transcription failed", str(e))
+                self.after(0, messagebox.showerror, "Transcription failed", str(e))
 
         threading.Thread(target=run, daemon=True).start()
 
     def _listen_mic(self) -> None:
         limit = self.limit_var.get() or None
+        language = self.lang_var.get().strip()
 
         def run():
             try:
-                text = speech_to_text(language=self.lang_var.get().strip(), phrase_time_limit=limit)
-                self._set_text(self.stt_text, text)
+                text = speech_to_text(language=language, phrase_time_limit=limit)
+                self.after(0, self._set_text, self.stt_text, text)
             except Exception as e:
-                messagebox.showerror("Microphone error", str(e))
+                self.after(0, messagebox.showerror, "Microphone error", str(e))
 
         threading.Thread(target=run, daemon=True).start()
 
@@ -232,9 +251,17 @@ class App(tk.Tk):
         widget.see(tk.END)
 
     @staticmethod
-    def _set_text(widget: tk.Text, text: str) -> None:
+    def _set_text(widget: tk.Text, text: str, slice_size: int = 65536) -> None:
+        """Replace the widget's content; must run on the Tk thread.
+
+        Large texts go in as slices with pending redraws flushed in between, so the
+        window keeps repainting during the insert. update_idletasks() doesn't process
+        input events, so the user can't edit the widget between slices.
+        """
         widget.delete("1.0", tk.END)
-        widget.insert("1.0", text)
+        for i in range(0, len(text), slice_size):
+            widget.insert(tk.END, text[i : i + slice_size])
+            widget.update_idletasks()
 
 
 def main() -> None:  # pragma: no cover
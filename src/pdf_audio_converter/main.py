@@ -25,32 +25,42 @@ Notes:
 from __future__ import annotations
 
 import argparse
+from itertools import chain
 from pathlib import Path
 
 from .config import Defaults
 from .logger import get_logger
-from .pdf_utils import extract_text_from_pdf, write_text_to_pdf
-from .tts import text_to_speech
-from .stt import transcribe_audio_file, speech_to_text
+
+# The TTS/STT/PDF modules pull in heavy third-party packages, so each command
+# imports only what it needs; `pdf-audio --help` loads none of them.
 
 logger = get_logger()
 
 
 def _cmd_tts(args: argparse.Namespace) -> int:
-    txt = extract_text_from_pdf(args.pdf, page_range=(args.start, args.end))
-    if not txt:
+    from .pdf_utils import extract_text_pages
+    from .tts import text_to_speech
+
+    pages = extract_text_pages(args.pdf, page_range=(args.start, args.end))
+    first = next((t for t in pages if t.strip()), None)
+    if first is None:
         logger.warning("No text extracted. Are you using a scanned PDF?")
+        return 0
     text_to_speech(
-        txt,
+        chain([first], pages),
         rate=args.rate or Defaults.tts_rate,
         volume=args.volume or Defaults.tts_volume,
         voice=args.voice,
         async_play=False,
+        cache=args.cache,
     )
     return 0
 
 
 def _cmd_stt(args: argparse.Namespace) -> int:
+    from .pdf_utils import write_text_to_pdf
+    from .stt import speech_to_text, transcribe_audio_file
+
     if args.mic:
         text = speech_to_text(language=args.lang or Defaults.language, 
                               phrase_time_limit=args.limit or Defaults.phrase_time_limit)
@@ -69,6 +79,8 @@ def _cmd_stt(args: argparse.Namespace) -> int:
 
     # Optionally speak back the transcription
     if args.speak_back:
+        from .tts import text_to_speech
+
         text_to_speech(text, rate=args.rate or Defaults.tts_rate, volume=args.volume or Defaults.tts_volume)
 
     return 0
@@ -86,6 +98,7 @@ def app(argv: list[str] | None = None) -> int:
     tts.add_argument("--rate", type=int, default=Defaults.tts_rate)
     tts.add_argument("--volume", type=float, default=Defaults.tts_volume)
     tts.add_argument("--voice", default=None, help="Voice name contains (e.g., 'Zira')")
+    tts.add_argument("--cache", action="store_true", help="Cache synthesized audio for re-reads (needs simpleaudio)")
     tts.set_defaults(func=_cmd_tts)
 
     stt = sub.add_parser("stt", help="Transcribe audio and export to PDF/TXT")
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=================================================================== 
+Project: PDF Audio Converter 
+File: pdf_utils.py 
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi) 
+Created: 2025-10-20 
+Updated: 2025-10-20 
+License: MIT License (see LICENSE file for details)
+=================================================================== 
+
+Description: 
+Utilities for extracting text from PDFs and writing text into a new PDF.
+
+Usage: 
+from .pdf_utils import extract_text_from_pdf, extract_text_pages, write_text_to_pdf
+
+Notes: 
+- Extraction uses PyMuPDF or pypdfium2 when installed (PyPDF2 fallback); override
+  with PDF_AUDIO_BACKEND. ReportLab is used for writing.
+
+===================================================================
+"""
+from __future__ import annotations
+
+import atexit
+import io
+import math
+import multiprocessing as mp
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from PyPDF2 import PdfReader
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfgen import canvas
+from reportlab.pdfgen.textobject import PDFTextObject
+
+from .logger import get_logger
+
+logger = get_logger()
+
+
+def extract_text_from_pdf(path: str | Path, page_range: tuple[int | None, int | None] = (None, None),
+                          *, backend: str | None = None) -> str:
+    """Extract text from a PDF.
+
+    Args:
+        path: Path to the PDF file.
+        page_range: (start, end) 1-based inclusive range; None for full.
+        backend: 'pymupdf', 'pypdfium2' or 'pypdf2'; None uses $PDF_AUDIO_BACKEND,
+            else the fastest installed one.
+
+    Returns:
+        Extracted text (may be empty when PDF is purely scanned images).
+    """
+    # Write pages into one buffer as they arrive instead of holding every page
+    # string alive until a final join.
+    buf = io.StringIO()
+    for txt in extract_text_pages(path, page_range, backend=backend):
+        buf.write(txt)
+        buf.write("\n")
+    return buf.getvalue().strip()
+
+
+def extract_text_pages(path: str | Path, page_range: tuple[int | None, int | None] = (None, None),
+                       *, backend: str | None = None) -> Iterator[str]:
+    """Lazily extract text from a PDF, one string per page.
+
+    The page range is validated up front; pages are then produced on demand so callers
+    can start using the first page before the rest are parsed. Large ranges are split
+    across worker processes; each worker opens the PDF itself. Recently opened PDFs
+    stay parsed in memory, keyed by path, mtime and size, so re-reads skip parsing.
+
+    Args:
+        path: Path to the PDF file.
+        page_range: (start, end) 1-based inclusive range; None for full.
+        backend: See :func:`extract_text_from_pdf`.
+    """
+    p = str(Path(path).resolve())
+    backend = _select_backend(backend)
+    start, end = _resolve_page_range(page_range, _page_count(p, backend))
+    return _iter_text_pages(p, backend, start, end)
+
+
+def _iter_text_pages(path: str, backend: str, start: int, end: int) -> Iterator[str]:
+    n = end - start + 1
+    workers = min(_cpu_count(), n)
+    if n < _PARALLEL_MIN_PAGES or workers < 2:
+        yield from _iter_pages(path, backend, start, end)
+        return
+
+    # The first pages are parsed right here so streaming callers (TTS) get them at
+    # once, while the pool (possibly still spawning) works through the rest in
+    # small slices that come back in order.
+    lead_end = start + _LEAD_PAGES - 1
+    size = min(math.ceil((end - lead_end) / workers), _SLICE_PAGES)
+    pool = _get_pool()
+    futures = []
+    try:
+        try:
+            futures = [pool.submit(_extract_pages, path, backend, s, min(s + size - 1, end))
+                       for s in range(lead_end + 1, end + 1, size)]
+        except BrokenProcessPool:
+            _discard_pool(pool)
+            futures = []
+        yield from _iter_pages(path, backend, start, lead_end)
+
+        next_page = lead_end + 1
+        for f in futures:
+            try:
+                part = f.result()
+            except BrokenProcessPool:
+                logger.warning("PDF worker pool crashed; extracting the remaining pages serially.")
+                _discard_pool(pool)
+                break
+            yield from part
+            next_page += len(part)
+        if next_page <= end:
+            yield from _iter_pages(path, backend, next_page, end)
+    finally:
+        for f in futures:
+            f.cancel()
+
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _cpu_count() -> int:
+    """CPUs this process may actually use (affinity / container cpusets), not the host total."""
+    if hasattr(os, "process_cpu_count"):  # Python 3.13+
+        return os.process_cpu_count() or 1
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Extraction pool shared by all calls in this process; shut down at exit."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            # spawn, not fork: callers such as the GUI extract from a background thread.
+            _POOL = ProcessPoolExecutor(max_workers=_cpu_count(), mp_context=mp.get_context("spawn"))
+            # Don't make interpreter exit (e.g. closing the GUI mid-read) wait for queued
+            # slices. concurrent.futures drains pending work from a threading exit hook
+            # that runs before atexit, so cancel from the same (LIFO) hook list.
+            stop = partial(_POOL.shutdown, wait=False, cancel_futures=True)
+            getattr(threading, "_register_atexit", atexit.register)(stop)
+        return _POOL
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    """Forget a broken pool so the next parallel extraction starts a fresh one."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is pool:
+            _POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+# Fastest first; PyPDF2 is a hard dependency and always the last resort.
+_BACKENDS = ("pymupdf", "pypdfium2", "pypdf2")
+
+# Below this many pages, process start-up costs more than it saves.
+_PARALLEL_MIN_PAGES = 32
+# Pages parsed in-process before pool results are used, and max pages per pool task.
+_LEAD_PAGES = 2
+_SLICE_PAGES = 16
+
+
+def _select_backend(backend: str | None) -> str:
+    if backend is None:
+        backend = os.environ.get("PDF_AUDIO_BACKEND") or None
+    if backend is None:
+        return next(b for b in _BACKENDS if b == "pypdf2" or find_spec(b))
+    backend = backend.lower()
+    if backend not in _BACKENDS:
+        raise ValueError(f"Unknown PDF backend: {backend!r}")
+    return backend
+
+
+def _resolve_page_range(page_range: tuple[int | None, int | None], n: int) -> tuple[int, int]:
+    start, end = page_range
+    if start is None:
+        start = 1
+    if end is None or end > n:
+        end = n
+    if start < 1 or start > end:
+        raise ValueError("Invalid page range")
+    return start, end
+
+
+def _page_count(path: str, backend: str) -> int:
+    with _DOC_LOCK:
+        doc = _open_document(path, backend)
+        if backend == "pymupdf":
+            return doc.page_count
+        if backend == "pypdfium2":
+            return len(doc)
+        return len(doc.pages)
+
+
+# Parsed documents are shared between calls and threads, and neither PDFium nor
+# MuPDF is thread-safe, so every touch of a cached document, including opening
+# it (and the cache evicting and freeing an old one), goes through this lock.
+_DOC_LOCK = threading.RLock()
+
+
+def _open_document(path: str, backend: str) -> Any:
+    st = os.stat(path)
+    return _open_cached(path, backend, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=4)
+def _open_cached(path: str, backend: str, mtime_ns: int, size: int) -> Any:
+    """Open a document once per file version; a modified file gets a new entry.
+
+    Only the calling process caches; pool workers open per call (see _extract_pages).
+    Bytes are read into memory so a cached document doesn't hold the file open
+    (which would block overwriting it on Windows).
+    """
+    return _open_file(path, backend, in_memory=True)
+
+
+def _open_file(path: str, backend: str, *, in_memory: bool = False) -> Any:
+    if backend == "pymupdf":
+        import pymupdf
+
+        if in_memory:
+            return pymupdf.open(stream=Path(path).read_bytes(), filetype="pdf")
+        return pymupdf.open(path)
+    if backend == "pypdfium2":
+        import pypdfium2
+
+        return pypdfium2.PdfDocument(Path(path).read_bytes() if in_memory else path)
+    return PdfReader(path)
+
+
+def _extract_pages(path: str, backend: str, start: int, end: int) -> list[str]:
+    """Extract pages start..end (1-based, inclusive); runs in worker processes.
+
+    Opens the PDF uncached and closes it afterwards, so long-lived pool workers
+    don't each keep copies of recently read documents.
+    """
+    doc = _open_file(path, backend)
+    try:
+        return list(_iter_doc_pages(doc, path, backend, start, end))
+    finally:
+        close = getattr(doc, "close", None)  # PyPDF2's reader has nothing to close
+        if close is not None:
+            close()
+
+
+def _iter_pages(path: str, backend: str, start: int, end: int) -> Iterator[str]:
+    with _DOC_LOCK:
+        doc = _open_document(path, backend)
+    return _iter_doc_pages(doc, path, backend, start, end)
+
+
+def _iter_doc_pages(doc: Any, path: str, backend: str, start: int, end: int) -> Iterator[str]:
+    if backend == "pymupdf":
+        page_text = _page_text_pymupdf
+    elif backend == "pypdfium2":
+        page_text = _page_text_pypdfium2
+    else:
+        page_text = _page_text_pypdf2
+
+    for i in range(start - 1, end):
+        try:
+            with _DOC_LOCK:
+                txt = page_text(doc, i) or ""
+        except Exception as e:
+            logger.warning("Could not extract text from page %d of %s: %s", i + 1, path, e)
+            txt = ""
+        yield txt
+
+
+def _page_text_pymupdf(doc: Any, i: int) -> str:
+    return doc[i].get_text("text")
+
+
+def _page_text_pypdfium2(doc: Any, i: int) -> str:
+    page = doc[i]
+    try:
+        textpage = page.get_textpage()
+        try:
+            return textpage.get_text_range()
+        finally:
+            textpage.close()
+    finally:
+        page.close()
+
+
+def _page_text_pypdf2(doc: Any, i: int) -> str:
+    return doc.pages[i].extract_text()
+
+
+def write_text_to_pdf(text: str, out_path: str | Path, *, title: str = "Transcription") -> Path:
+    """Create a simple PDF with the given text content using ReportLab."""
+    out = Path(out_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    c = canvas.Canvas(str(out), pagesize=A4)
+    width, height = A4
+
+    # Word-wrapping with real font metrics; one text object per page keeps the
+    # content stream to a single BT/ET block instead of one per line.
+    margin = 50
+    line_height = 14
+    font_name, font_size = "Times-Roman", 12
+    c.setTitle(title)
+
+    def new_text() -> PDFTextObject:
+        t = c.beginText(margin, height - margin)
+        t.setFont(font_name, font_size, leading=line_height)
+        return t
+
+    t = new_text()
+    lines = _wrap_text(text.splitlines() or [""], max_width=width - 2 * margin,
+                       font_name=font_name, font_size=font_size)
+    for line in lines:
+        if t.getY() < margin:
+            c.drawText(t)
+            c.showPage()
+            t = new_text()
+        t.textLine(line)
+    c.drawText(t)
+
+    c.save()
+    return out
+
+
+def _wrap_text(lines: Iterable[str], max_width: float, *,
+               font_name: str = "Times-Roman", font_size: float = 12) -> Iterable[str]:
+    """Wrap lines to fit ``max_width`` points, breaking at spaces using ReportLab's metrics."""
+    for line in lines:
+        yield from _wrap_line(line, max_width, font_name, font_size)
+
+
+def _wrap_line(line: str, max_width: float, font_name: str, font_size: float) -> Iterator[str]:
+    space = _string_width(" ", font_name, font_size)
+    words: list[str] = []
+    used = 0.0
+    for word in line.split(" "):
+        w = _string_width(word, font_name, font_size)
+        if words and used + space + w > max_width:
+            yield " ".join(words)
+            words, used = [], 0.0
+        if w > max_width:
+            # A single word wider than the line: break it between characters.
+            cut, w = 0, 0.0
+            for j, ch in enumerate(word):
+                cw = _string_width(ch, font_name, font_size)
+                if j > cut and w + cw > max_width:
+                    yield word[cut:j]
+                    cut, w = j, 0.0
+                w += cw
+            word = word[cut:]
+        used = used + space + w if words else w
+        words.append(word)
+    yield " ".join(words)
+
+
+@lru_cache(maxsize=8192)
+def _string_width(s: str, font_name: str, font_size: float) -> float:
+    return pdfmetrics.stringWidth(s, font_name, font_size)
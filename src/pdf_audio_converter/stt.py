@@ -17,15 +17,22 @@ Usage:
 from .stt import speech_to_text, transcribe_audio_file
 
 Notes: 
-- Defaults to Google Web Speech API (requires internet). Swap recognizer as needed.
+- Defaults to Google Web Speech API (requires internet). Set STT_BACKEND=whisper to
+  run faster-whisper locally instead (offline, int8 on CPU).
 - Microphone capture requires PyAudio (or alternative backends).
+- With pydub installed, long files are split on silence and recognized in parallel.
 
 ===================================================================
 """
 from __future__ import annotations
 
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import Any, BinaryIO, Iterable, Optional
 
 import speech_recognition as sr
 
@@ -34,7 +41,33 @@ from .logger import get_logger
 logger = get_logger()
 
 
+_STT_BACKENDS = ("google", "whisper")
+
+
+def _stt_backend() -> str:
+    backend = (os.environ.get("STT_BACKEND") or "google").lower()
+    if backend not in _STT_BACKENDS:
+        raise ValueError(f"Unknown STT backend: {backend!r}")
+    return backend
+
+
+@lru_cache(maxsize=1)
+def _whisper_model() -> Any:
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as e:
+        raise RuntimeError("STT_BACKEND=whisper needs faster-whisper (pip install faster-whisper)") from e
+    return WhisperModel(os.environ.get("WHISPER_MODEL", "base"), device="cpu", compute_type="int8")
+
+
+def _recognize_whisper(source: str | BinaryIO, language: str) -> str:
+    segments, _ = _whisper_model().transcribe(source, language=language.split("-")[0])
+    return " ".join(s.text.strip() for s in segments).strip()
+
+
 def _recognize(recognizer: sr.Recognizer, audio: sr.AudioData, language: str) -> str:
+    if _stt_backend() == "whisper":
+        return _recognize_whisper(io.BytesIO(audio.get_wav_data()), language)
     try:
         return recognizer.recognize_google(audio, language=language)
     except sr.UnknownValueError:
@@ -44,14 +77,98 @@ def _recognize(recognizer: sr.Recognizer, audio: sr.AudioData, language: str) ->
         return ""
 
 
-def transcribe_audio_file(path: str | Path, *, language: str = "en-US") -> str:
-    """Transcribe an audio file to text using SpeechRecognition."""
+# Files longer than this are split on silence (when pydub is available) and the
+# pieces are sent to the recognizer concurrently; the calls are network-bound.
+_LONG_AUDIO_SECONDS = 60
+_CHUNK_MAX_MS = 30_000
+
+
+def transcribe_audio_file(path: str | Path, *, language: str = "en-US", max_workers: int = 8) -> str:
+    """Transcribe an audio file to text using SpeechRecognition.
+
+    Args:
+        path: Audio file (wav/aiff/flac; anything ffmpeg reads when pydub is installed).
+        language: BCP-47 code (e.g., 'en-US', 'fa-IR').
+        max_workers: Concurrent recognizer calls for long, silence-split files.
+    """
+    if _stt_backend() == "whisper":
+        # Whisper reads the file itself and handles long audio natively.
+        return _recognize_whisper(str(path), language)
+
+    if find_spec("pydub") is not None:
+        text = _transcribe_long(path, language, max_workers)
+        if text is not None:
+            return text
+
     recognizer = sr.Recognizer()
     with sr.AudioFile(str(path)) as source:
         audio = recognizer.record(source)
     return _recognize(recognizer, audio, language)
 
 
+def _transcribe_long(path: str | Path, language: str, max_workers: int) -> Optional[str]:
+    """Split a long file on silence and recognize the pieces in parallel.
+
+    Returns None when the file is short enough for a single request, or when pydub
+    can't decode it (e.g. AIFF/FLAC without ffmpeg), so the caller falls back to the
+    plain ``sr.AudioFile`` path.
+    """
+    from pydub import AudioSegment
+    from pydub.exceptions import CouldntDecodeError
+    from pydub.silence import split_on_silence
+
+    # Read the header first; short files never pay for a full pydub decode.
+    duration = _audio_duration(path)
+    if duration is not None and duration <= _LONG_AUDIO_SECONDS:
+        return None
+    try:
+        seg = AudioSegment.from_file(str(path))
+    except (FileNotFoundError, CouldntDecodeError) as e:
+        logger.info("pydub can't decode %s (%s); transcribing in one request.", path, e)
+        return None
+    if seg.duration_seconds <= _LONG_AUDIO_SECONDS:
+        return None
+    pieces = split_on_silence(seg, min_silence_len=500, silence_thresh=seg.dBFS - 16, keep_silence=250)
+    chunks = list(_pack_segments(pieces, _CHUNK_MAX_MS))
+    if len(chunks) < 2:
+        return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        texts = list(pool.map(partial(_recognize_segment, language=language), chunks))
+    return " ".join(t for t in texts if t)
+
+
+def _audio_duration(path: str | Path) -> Optional[float]:
+    """Duration in seconds from the file header, or None if SpeechRecognition can't read it."""
+    try:
+        with sr.AudioFile(str(path)) as source:
+            return source.DURATION
+    except (ValueError, OSError, EOFError):
+        return None
+
+
+def _pack_segments(pieces: Iterable[Any], max_ms: int) -> Iterable[Any]:
+    """Merge consecutive pydub segments into chunks of at most ``max_ms`` (when possible)."""
+    buf = None
+    for piece in pieces:
+        if buf is not None and len(buf) + len(piece) > max_ms:
+            yield buf
+            buf = None
+        buf = piece if buf is None else buf + piece
+    if buf is not None:
+        yield buf
+
+
+def _recognize_segment(segment: Any, *, language: str) -> str:
+    wav = io.BytesIO()
+    segment.export(wav, format="wav")
+    wav.seek(0)
+    recognizer = sr.Recognizer()
+    with sr.AudioFile(wav) as source:
+        audio = recognizer.record(source)
+    return _recognize(recognizer, audio, language)
+
+
 def speech_to_text(*, language: str = "en-US", phrase_time_limit: Optional[int] = None) -> str:
     """Record from default microphone and transcribe to text.
 
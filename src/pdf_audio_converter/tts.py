@@ -18,14 +18,32 @@ from .tts import text_to_speech
 
 Notes: 
 - Offline and cross-platform (SAPI5, NSSpeechSynthesizer, eSpeak).
+- Optional WAV cache (cache=True) replays repeated chunks via simpleaudio.
+- pyttsx3 runs in a dedicated worker process, fed chunks through a queue, so
+  synthesis never competes with the GUI/CLI process for the GIL or event loop.
+- The worker is started with the "spawn" method, which re-imports the calling
+  script: scripts that call text_to_speech() must do so under an
+  ``if __name__ == "__main__":`` guard, or the worker fails to start.
+- stop() kills the worker, so the next call pays for a new process, pyttsx3
+  init and voice lookup (typically a fraction of a second to a few seconds).
 
 ===================================================================
 """
 from __future__ import annotations
 
+import hashlib
+import multiprocessing as mp
+import os
+import queue
+import re
+import tempfile
 import threading
+import time
 from dataclasses import dataclass
-from typing import Optional, Iterable
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import Any, Callable, Optional, Iterable, Iterator
 
 import pyttsx3
 
@@ -33,72 +51,360 @@ from .logger import get_logger
 
 logger = get_logger()
 
+_SENT_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 @dataclass
 class TTSConfig:
     rate: int = 180
     volume: float = 0.9
     voice: Optional[str] = None  # voice id substring to match
+    cache: bool = False  # replay synthesized WAVs for repeated text (needs simpleaudio)
+
+
+_CACHE_DIR = Path(tempfile.gettempdir()) / "pdf_audio_cache"
+_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_TMP_MAX_AGE = 3600  # seconds; partial WAVs older than this are abandoned
+
+
+class TTSWorkerError(RuntimeError):
+    """The speech worker process failed (e.g. no speech driver) or died."""
 
 
 class TTSEngine:
+    """Feeds text chunks to a speech worker process that owns pyttsx3.
+
+    The process is started on first use and kept for later calls; stop() kills it
+    mid-utterance and the next call starts a fresh one.
+    """
+
     def __init__(self, cfg: TTSConfig) -> None:
         self.cfg = cfg
-        self.engine = pyttsx3.init()
-        self._configure()
+        self._ctx = mp.get_context("spawn")  # no fork: the parent may be running Tk or threads
+        self._proc: Optional[mp.process.BaseProcess] = None
+        self._commands: Any = None  # mp.Queue of (kind, arg) tuples or None to quit
+        self._events: Any = None  # mp.Queue of (kind, detail) replies
         self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._busy = False
 
-    def _configure(self) -> None:
-        self.engine.setProperty("rate", self.cfg.rate)
-        self.engine.setProperty("volume", self.cfg.volume)
-        if self.cfg.voice:
-            for v in self.engine.getProperty("voices"):
-                if self.cfg.voice.lower() in (v.name or "").lower():
-                    self.engine.setProperty("voice", v.id)
-                    break
+    def _ensure_worker(self) -> tuple[mp.process.BaseProcess, Any, Any]:
+        if self._proc is None or not self._proc.is_alive():
+            self._commands = self._ctx.Queue(maxsize=8)
+            self._events = self._ctx.Queue()
+            self._proc = self._ctx.Process(target=_tts_worker, args=(self._commands, self._events), daemon=True)
+            self._proc.start()
+        return self._proc, self._commands, self._events
 
     def speak(self, chunks: Iterable[str]) -> None:
-        """Speak an iterable of text chunks synchronously."""
-        for chunk in chunks:
-            if not chunk:
-                continue
-            self.engine.say(chunk)
-        self.engine.runAndWait()
-
-    def speak_async(self, chunks: Iterable[str]) -> None:
+        """Speak an iterable of text chunks synchronously.
+
+        Chunks are queued to the worker as they are produced, so a slow producer
+        (e.g. PDF extraction) keeps working while earlier chunks are being spoken.
+        """
+        self._speak(chunks, self._begin())
+
+    def speak_async(self, chunks: Iterable[str],
+                    on_error: Optional[Callable[[Exception], None]] = None) -> None:
+        """Speak in the background; failures go to ``on_error`` (called on the feeder thread)."""
         self.stop()
-        self._thread = threading.Thread(target=self.speak, args=(list(chunks),), daemon=True)
+        if self._thread is not None and self._thread.is_alive():
+            self._thread.join(timeout=1.0)
+        # Feed the iterable from a thread; synthesis itself happens in the worker process.
+        self._thread = threading.Thread(target=self._speak_reporting,
+                                        args=(chunks, self._begin(), on_error), daemon=True)
         self._thread.start()
 
+    def _speak_reporting(self, chunks: Iterable[str], stopped: threading.Event,
+                         on_error: Optional[Callable[[Exception], None]]) -> None:
+        try:
+            self._speak(chunks, stopped)
+        except Exception as e:
+            if on_error is None:
+                logger.error("TTS playback failed: %s", e)
+            else:
+                on_error(e)
+
+    def _begin(self) -> threading.Event:
+        # A fresh event per call, so a stop() aimed at an earlier call can't be undone.
+        self._stopped = threading.Event()
+        self._busy = True
+        return self._stopped
+
+    def _speak(self, chunks: Iterable[str], stopped: threading.Event) -> None:
+        proc = None
+        try:
+            proc, commands, events = self._ensure_worker()
+            if not _put(commands, ("config", self.cfg), stopped, proc, events):
+                return
+            for chunk in chunks:
+                if chunk and not _put(commands, ("say", chunk), stopped, proc, events):
+                    return
+            if _put(commands, ("flush", None), stopped, proc, events):
+                _wait_done(events, stopped, proc)
+        except TTSWorkerError:
+            # Don't let the next call reuse a worker that is still on its way out.
+            if proc is not None:
+                self._discard_worker(proc)
+            raise
+        finally:
+            if stopped is self._stopped:
+                self._busy = False
+
+    def _discard_worker(self, proc: mp.process.BaseProcess) -> None:
+        proc.join(timeout=1.0)
+        if proc.is_alive():
+            proc.terminate()
+            proc.join(timeout=1.0)
+        if self._proc is proc:
+            self._proc = None
+
     def stop(self) -> None:
+        self._stopped.set()
+        proc = self._proc
+        if self._busy and proc is not None:
+            proc.terminate()
+            proc.join(timeout=1.0)
+            self._proc = None
+
+
+def _put(commands: Any, item: object, stopped: threading.Event,
+         proc: mp.process.BaseProcess, events: Any) -> bool:
+    """Blocking put that gives up when stopped or when the worker has died."""
+    while not stopped.is_set():
+        try:
+            commands.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            # stop() kills the worker on purpose; only a death we didn't ask for is an error.
+            if not proc.is_alive() and not stopped.is_set():
+                _raise_worker_error(events)
+    return False
+
+
+def _wait_done(events: Any, stopped: threading.Event, proc: mp.process.BaseProcess) -> None:
+    while not stopped.is_set():
+        try:
+            kind, detail = events.get(timeout=0.1)
+        except queue.Empty:
+            if not proc.is_alive() and not stopped.is_set():
+                _raise_worker_error(events)
+            continue
+        if kind == "error":
+            raise TTSWorkerError(f"TTS worker failed: {detail}")
+        return
+
+
+def _raise_worker_error(events: Any) -> None:
+    try:
+        _, detail = events.get_nowait()
+    except queue.Empty:
+        detail = "exited unexpectedly"
+    raise TTSWorkerError(f"TTS worker failed: {detail}")
+
+
+def _tts_worker(commands: Any, events: Any) -> None:
+    """Speech process main loop: owns the pyttsx3 engine for its whole life."""
+    try:
+        engine = pyttsx3.init()
+        default_voice = engine.getProperty("voice")
+        cfg: Optional[TTSConfig] = None
+        while True:
+            cmd = commands.get()
+            if cmd is None:
+                return
+            kind, arg = cmd
+            if kind == "config":
+                if arg != cfg:
+                    cfg = arg
+                    _configure(engine, cfg, default_voice)
+            elif kind == "say" and cfg is not None:
+                if cfg.cache and _can_play_wav():
+                    _play_cached(engine, cfg, arg)
+                else:
+                    engine.say(arg)
+                    engine.runAndWait()
+            elif kind == "flush":
+                events.put(("done", None))
+    except Exception as e:
+        events.put(("error", repr(e)))
+
+
+def _configure(engine: Any, cfg: TTSConfig, default_voice: Any) -> None:
+    engine.setProperty("rate", cfg.rate)
+    engine.setProperty("volume", cfg.volume)
+    voice_id = _resolve_voice(cfg.voice) if cfg.voice else None
+    engine.setProperty("voice", voice_id or default_voice)
+
+
+@lru_cache(maxsize=1)
+def _voices() -> tuple:
+    """Installed voices; enumerating them is slow on SAPI5/NSSpeech, so do it once."""
+    return tuple(pyttsx3.init().getProperty("voices"))
+
+
+@lru_cache(maxsize=32)
+def _resolve_voice(name: str) -> Optional[str]:
+    """Id of the first voice whose name contains ``name`` (case-insensitive)."""
+    needle = name.lower()
+    for v in _voices():
+        if needle in (v.name or "").lower():
+            return v.id
+    return None
+
+
+def _play_cached(engine: Any, cfg: TTSConfig, chunk: str) -> None:
+    import simpleaudio
+
+    key = f"{cfg.rate}|{cfg.volume}|{engine.getProperty('voice')}|{chunk}"
+    wav = _CACHE_DIR / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.wav"
+    if wav.exists():
+        os.utime(wav)  # mark as recently used
+    else:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = wav.with_name(f"{wav.stem}.{os.getpid()}.tmp.wav")
+        engine.save_to_file(chunk, str(tmp))
+        engine.runAndWait()
+        os.replace(tmp, wav)
+        _evict_cache()
+    simpleaudio.WaveObject.from_wave_file(str(wav)).play().wait_done()
+
+
+@lru_cache(maxsize=1)
+def _can_play_wav() -> bool:
+    if find_spec("simpleaudio") is None:
+        logger.warning("simpleaudio is not installed; audio caching disabled.")
+        return False
+    return True
+
+
+def _evict_cache() -> None:
+    """Delete least recently used WAVs until the cache fits in _CACHE_MAX_BYTES.
+
+    Also removes partial ``<key>.<pid>.tmp.wav`` files left by a worker that was
+    killed mid-save (e.g. by stop()).
+    """
+    try:
+        files = [(f.stat(), f) for f in _CACHE_DIR.glob("*.wav")]
+    except OSError:
+        return
+    entries = []
+    for st, f in files:
+        if ".tmp." not in f.name:
+            entries.append((st, f))
+        elif _tmp_is_stale(f, st):
+            try:
+                f.unlink()
+            except OSError:
+                pass
+    total = sum(st.st_size for st, _ in entries)
+    for st, f in sorted(entries, key=lambda e: e[0].st_mtime):
+        if total <= _CACHE_MAX_BYTES:
+            break
         try:
-            self.engine.stop()
-        except Exception:
-            pass
+            f.unlink()
+        except OSError:
+            continue
+        total -= st.st_size
+
+
+def _tmp_is_stale(f: Path, st: os.stat_result) -> bool:
+    if time.time() - st.st_mtime > _TMP_MAX_AGE:
+        return True
+    try:
+        pid = int(f.name.split(".")[1])
+    except (IndexError, ValueError):
+        return True
+    return not _pid_alive(pid)
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # os.kill() would terminate it; rely on _TMP_MAX_AGE there
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # exists but belongs to someone else
+    return True
+
+
+def _chunk_text(text: str, chunk_size: int) -> Iterator[str]:
+    """Pack whole sentences into chunks of at most ``chunk_size`` characters.
+
+    A sentence longer than ``chunk_size`` is cut at the last space that fits
+    (or hard-cut when there is none).
+    """
+    buf = ""
+    for sent in _SENT_RE.split(text.strip()):
+        start = 0
+        while len(sent) - start > chunk_size:
+            cut = sent.rfind(" ", start, start + chunk_size + 1)
+            if cut <= start:
+                cut = start + chunk_size
+            if buf:
+                yield buf
+                buf = ""
+            yield sent[start:cut]
+            start = cut
+            while start < len(sent) and sent[start].isspace():
+                start += 1
+        sent = sent[start:]
+        if not sent:
+            continue
+        if buf and len(buf) + 1 + len(sent) > chunk_size:
+            yield buf
+            buf = sent
+        else:
+            buf = f"{buf} {sent}" if buf else sent
+    if buf:
+        yield buf
+
+
+_shared: Optional[TTSEngine] = None
+_shared_lock = threading.Lock()
+
+
+def _shared_engine(cfg: TTSConfig) -> TTSEngine:
+    """Process-wide engine, so its speech worker process is reused across calls."""
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = TTSEngine(cfg)
+        else:
+            _shared.stop()
+            _shared.cfg = cfg
+        return _shared
 
 
-def text_to_speech(text: str, *, rate: int = 180, volume: float = 0.9, voice: Optional[str] = None,
-                   chunk_size: int = 1800, async_play: bool = False) -> TTSEngine:
+def text_to_speech(text: str | Iterable[str], *, rate: int = 180, volume: float = 0.9, voice: Optional[str] = None,
+                   chunk_size: int = 1800, async_play: bool = False, cache: bool = False,
+                   on_error: Optional[Callable[[Exception], None]] = None) -> TTSEngine:
     """Speak the given text using pyttsx3.
 
     Args:
-        text: Content to speak.
+        text: Content to speak; an iterable of strings (e.g. PDF pages) is spoken
+            as it is produced.
         rate: Words per minute (approx).
         volume: 0.0–1.0.
         voice: Optional voice name substring to select.
-        chunk_size: Split text into manageable chunks.
+        chunk_size: Max characters per chunk; chunks break at sentence ends.
         async_play: If True, returns immediately while playing.
+        cache: If True, keep synthesized WAVs in a temp dir and replay them when the
+            same chunk is read again with the same settings (needs simpleaudio).
+        on_error: With async_play, called with any playback failure (from a
+            background thread); without it the failure is logged.
     """
-    cfg = TTSConfig(rate=rate, volume=volume, voice=voice)
-    engine = TTSEngine(cfg)
+    cfg = TTSConfig(rate=rate, volume=volume, voice=voice, cache=cache)
+    engine = _shared_engine(cfg)
 
     def chunks() -> Iterable[str]:
-        s = text.strip()
-        for i in range(0, len(s), chunk_size):
-            yield s[i : i + chunk_size]
+        for part in ([text] if isinstance(text, str) else text):
+            yield from _chunk_text(part, chunk_size)
 
     if async_play:
-        engine.speak_async(chunks())
+        engine.speak_async(chunks(), on_error=on_error)
     else:
         engine.speak(chunks())
     return engine
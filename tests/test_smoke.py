@@ -21,8 +21,21 @@ Notes:
 
 ===================================================================
 """
-from pdf_audio_converter import __version__
-from pdf_audio_converter.pdf_utils import _wrap_text
+from importlib.util import find_spec
+
+import pytest
+from reportlab.pdfbase import pdfmetrics
+
+from pdf_audio_converter import __version__, pdf_utils
+from pdf_audio_converter.pdf_utils import (
+    _resolve_page_range,
+    _wrap_text,
+    extract_text_from_pdf,
+    extract_text_pages,
+    write_text_to_pdf,
+)
+from pdf_audio_converter.stt import _pack_segments
+from pdf_audio_converter.tts import _chunk_text
 
 
 def test_version() -> None:
@@ -30,5 +43,80 @@ def test_version() -> None:
 
 
 def test_wrap_text() -> None:
-    lines = list(_wrap_text(["abcdefghij"], max_width=30, char_width=6))
-    assert lines  # not empty
+    # A word wider than the line is broken between characters.
+    lines = list(_wrap_text(["abcdefghij"], max_width=30))
+    assert len(lines) > 1
+    assert "".join(lines) == "abcdefghij"
+    assert all(pdfmetrics.stringWidth(line, "Times-Roman", 12) <= 30 for line in lines)
+    assert list(_wrap_text([""], max_width=30)) == [""]
+
+
+@pytest.fixture(scope="module")
+def long_pdf(tmp_path_factory):
+    # Long enough (40+ pages) to take the parallel extraction path.
+    pdf = tmp_path_factory.mktemp("pdf") / "long.pdf"
+    write_text_to_pdf("\n".join(f"Line {i} of the long document." for i in range(2100)), pdf)
+    return pdf
+
+
+def _words(pages) -> list[list[str]]:
+    # Backends differ in line breaks and trailing whitespace, not in the words.
+    return [page.split() for page in pages]
+
+
+def test_backends_agree(long_pdf) -> None:
+    installed = [b for b in pdf_utils._BACKENDS if b == "pypdf2" or find_spec(b)]
+    results = {b: _words(extract_text_pages(long_pdf, backend=b)) for b in installed}
+    expected = results.pop("pypdf2")
+    assert expected[0][:4] == ["Line", "0", "of", "the"]
+    for backend, pages in results.items():
+        assert pages == expected, backend
+
+
+def test_parallel_extraction_matches_serial(long_pdf, monkeypatch) -> None:
+    backend = pdf_utils._select_backend(None)
+    n = pdf_utils._page_count(str(long_pdf), backend)
+    assert n >= pdf_utils._PARALLEL_MIN_PAGES
+    serial = list(pdf_utils._iter_pages(str(long_pdf), backend, 1, n))
+    monkeypatch.setattr(pdf_utils, "_cpu_count", lambda: 4)
+    parallel = list(pdf_utils._iter_text_pages(str(long_pdf), backend, 1, n))
+    assert pdf_utils._POOL is not None  # really went through the pool
+    assert parallel == serial
+
+
+def test_resolve_page_range() -> None:
+    assert _resolve_page_range((None, None), 5) == (1, 5)
+    assert _resolve_page_range((2, 99), 5) == (2, 5)
+    with pytest.raises(ValueError):
+        _resolve_page_range((4, 2), 5)
+
+
+def test_wrap_text_font_metrics() -> None:
+    lines = list(_wrap_text(["lorem ipsum dolor sit amet"], max_width=60, font_name="Times-Roman"))
+    assert len(lines) > 1
+    assert " ".join(lines) == "lorem ipsum dolor sit amet"
+
+
+def test_chunk_text_sentences() -> None:
+    text = "One two. Three four! Five six seven eight nine ten eleven."
+    chunks = list(_chunk_text(text, chunk_size=20))
+    assert chunks == ["One two. Three four!", "Five six seven eight", "nine ten eleven."]
+    assert all(len(c) <= 20 for c in chunks)
+
+
+def test_pack_segments() -> None:
+    # Anything with len() and + works; strings stand in for pydub segments.
+    assert list(_pack_segments(["aa", "bbb", "c", "dddd"], max_ms=4)) == ["aa", "bbbc", "dddd"]
+    assert list(_pack_segments(["toolong"], max_ms=4)) == ["toolong"]
+    assert list(_pack_segments([], max_ms=4)) == []
+
+
+def test_extract_sees_rewritten_pdf(tmp_path) -> None:
+    # The parsed-document cache is keyed on mtime and size, so a rewrite must not serve stale text.
+    pdf = tmp_path / "doc.pdf"
+    write_text_to_pdf("first version", pdf)
+    assert "first version" in extract_text_from_pdf(pdf)
+    write_text_to_pdf("second, longer version of the text", pdf)
+    text = extract_text_from_pdf(pdf)
+    assert "second, longer version" in text
+    assert "first version" not in text
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+=================================================================== 
+Project: PDF Audio Converter 
+File: test_tts_worker.py 
+Author: Mobin Yousefi (GitHub: github.com/mobinyousefi) 
+Created: 2026-10-14 
+Updated: 2026-10-14 
+License: MIT License (see LICENSE file for details)
+=================================================================== 
+
+Description: 
+Tests for the TTS worker process (run against a stub pyttsx3) and WAV cache.
+
+Usage: 
+pytest -q
+
+Notes: 
+- The stub is put on sys.path, which spawn children inherit, so no speech
+  driver is needed.
+
+===================================================================
+"""
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from pdf_audio_converter import tts
+
+STUB = '''
+import time
+
+
+class _Engine:
+    def __init__(self):
+        self.props = {"voice": "default"}
+
+    def setProperty(self, key, value):
+        self.props[key] = value
+
+    def getProperty(self, key):
+        return [] if key == "voices" else self.props.get(key)
+
+    def say(self, text):
+        pass
+
+    def runAndWait(self):
+        time.sleep(5)  # long enough that stop() always lands mid-utterance
+
+    def stop(self):
+        pass
+
+
+def init(*args, **kwargs):
+    return _Engine()
+'''
+
+
+@pytest.fixture()
+def stub_pyttsx3(tmp_path, monkeypatch):
+    (tmp_path / "pyttsx3.py").write_text(STUB, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(tts, "_shared", None)
+    yield
+    if tts._shared is not None:
+        tts._shared.stop()
+
+
+def test_stop_during_async_playback_is_not_an_error(stub_pyttsx3) -> None:
+    errors: list[Exception] = []
+    # Many small chunks fill the bounded command queue, so the feeder thread is
+    # blocked in put() when stop() kills the worker.
+    text = " ".join(f"Sentence {i}." for i in range(40))
+    for _ in range(2):
+        engine = tts.text_to_speech(text, chunk_size=12, async_play=True, on_error=errors.append)
+        time.sleep(1.0)
+        engine.stop()
+        engine._thread.join(timeout=5)
+        assert not engine._thread.is_alive()
+    assert errors == []
+
+
+@pytest.mark.skipif(os.name == "nt", reason="pid liveness is not probed on Windows")
+def test_evict_cache_removes_abandoned_tmp_files(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(tts, "_CACHE_DIR", tmp_path)
+    done = subprocess.run([sys.executable, "-c", "import os; print(os.getpid())"],
+                          capture_output=True, text=True, check=True)
+    dead = tmp_path / f"aaa.{done.stdout.strip()}.tmp.wav"
+    live = tmp_path / f"bbb.{os.getpid()}.tmp.wav"
+    old = tmp_path / f"ccc.{os.getpid()}.tmp.wav"
+    kept = tmp_path / "ddd.wav"
+    for f in (dead, live, old, kept):
+        f.write_bytes(b"RIFF")
+    os.utime(old, (time.time() - 2 * tts._TMP_MAX_AGE,) * 2)
+    tts._evict_cache()
+    assert sorted(f.name for f in tmp_path.iterdir()) == sorted([live.name, kept.name])